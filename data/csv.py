@@ -1,5 +1,51 @@
 import csv
+import io
+import mmap
 import random
+import sys
+from array import array
+
+#: Module-private generator so Csv sampling never reads or mutates the
+#: global random state shared with user code.
+_rng = random.Random()
+
+
+def _parse_numeric_blob(body: str) -> list:
+    """
+    Parse an unquoted, purely numeric CSV body in a single flat pass.
+
+    Instead of splitting and converting one line at a time, the whole body
+    is flattened into one field stream and converted with a single
+    map(float) pass into a contiguous ``array('d')`` — the float loop then
+    runs end-to-end in C with no per-row Python frames. Rows are sliced
+    back out of the flat buffer afterwards.
+
+    Args:
+        body (str): CSV data without the header line, '\\n' line endings.
+
+    Returns:
+        list: List of row lists of floats.
+
+    Raises:
+        ValueError: If the rows are ragged or a field is not numeric.
+    """
+    # Strip only the trailing newline: interior empty fields must stay in
+    # the stream so float('') raises instead of silently dropping them.
+    body = body.rstrip("\n")
+    first_end = body.find("\n")
+    first_line = body[:first_end] if first_end != -1 else body
+    if not first_line:
+        raise ValueError("Cannot flat-parse ragged or empty CSV body")
+    ncols = first_line.count(",") + 1
+    # Every line must have exactly ncols fields before flattening —
+    # checking only the total field count would accept ragged bodies
+    # whose short and long lines happen to compensate. str.count runs as
+    # a C scan per line, so this stays cheap.
+    commas = ncols - 1
+    if any(line.count(",") != commas for line in body.split("\n")):
+        raise ValueError("Cannot flat-parse ragged or empty CSV body")
+    values = array("d", map(float, body.replace("\n", ",").split(",")))
+    return [values[i:i + ncols].tolist() for i in range(0, len(values), ncols)]
 
 
 class Csv:
@@ -10,20 +56,133 @@ class Csv:
     without relying on any external libraries beyond the Python standard library.
     """
 
-    def __init__(self, file_path: str = None):
+    #: Recognised parser backends, in the order "auto" tries them.
+    BACKENDS = ("native", "cisv", "pyarrow", "stdlib")
+
+    def __init__(
+        self,
+        file_path: str = None,
+        backend: str = "auto",
+        typecode: str = "d",
+        schema: dict = None,
+        has_header: bool = True,
+        lazy: bool = False,
+    ):
         """
         Initialize the Csv object. Optionally loads a CSV file from the given path.
 
         Args:
             file_path (str, optional): Path to the CSV file. Defaults to None.
+            backend (str): Parser backend: "native" for a user-compiled
+                           data._csv_fast extension, "cisv" or "pyarrow" to
+                           use those libraries when installed, "stdlib" to
+                           force the pure-Python parser, or "auto" to pick
+                           the fastest available one. Defaults to "auto".
+            typecode (str): Element type of the column arrays: "d" for
+                            C doubles or "f" for C floats, which halves
+                            column memory when single precision is enough.
+                            Defaults to "d".
+            schema (dict, optional): Mapping of column name (or index if
+                                     there is no header) to a converter
+                                     such as int or str. Unlisted columns
+                                     stay float. Converters run once at
+                                     parse time, avoiding a later
+                                     cast pass. Defaults to None.
+            has_header (bool): Whether the file has a header row.
+                               Defaults to True.
+            lazy (bool): If True, defer float conversion: the file is only
+                         split into lines at load time, and cells are
+                         parsed when rows or columns are first accessed.
+                         Useful when only a few rows/columns of a large
+                         file are needed. Defaults to False.
         """
+        if typecode not in ("d", "f"):
+            raise ValueError(f"Unknown typecode '{typecode}'. Expected 'd' or 'f'")
+        self.typecode = typecode
+        self.schema = schema
+        if backend != "auto" and backend not in self.BACKENDS:
+            raise ValueError(
+                f"Unknown backend '{backend}'. Expected 'auto' or one of {self.BACKENDS}"
+            )
+        self.backend = backend
+        self._has_header = has_header
         self.header = None
         self.rows = []
+        self._raw_lines = None
+        self._lazy_rows = None
+        self._lazy_columns = None
 
         if file_path:
             self.file_path = file_path
+            if lazy and schema is None and self._load_lazy():
+                self._length = len(self._raw_lines)
+                return
             self.header, self.rows = self._load_csv()
             self._length = len(self.rows)
+            if self.rows:
+                self._ncols = len(self.rows[0])
+
+    @property
+    def rows(self) -> list:
+        """
+        Row data as a list of lists. For a lazily loaded Csv, the first
+        access parses the whole file and caches the result.
+        """
+        if self._rows is None:
+            self._parse_all()
+        return self._rows
+
+    @rows.setter
+    def rows(self, rows) -> None:
+        self._rows = rows
+        self._raw_lines = None
+        self._lazy_rows = None
+        self._lazy_columns = None
+        self._columns = None
+        self._ncols = None
+        self._row_keys = None
+
+    def _load_lazy(self) -> bool:
+        """
+        Load only the raw lines of the file, deferring float conversion.
+
+        Returns:
+            bool: True if the deferred load happened; False when the file
+                  needs the full parser (quoted fields), in which case the
+                  caller falls back to the eager path.
+        """
+        with open(self.file_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[:].decode()
+            except ValueError:  # empty files cannot be mmapped
+                data = f.read().decode()
+
+        # Exact sniff over the whole blob: one C-level scan of a string
+        # already in memory, and a truncated window would misroute files
+        # whose first quoted field sits past it.
+        if '"' in data:
+            return False
+
+        data = data.replace("\r\n", "\n")
+        lines = data.split("\n")
+        if self._has_header:
+            self.header = lines[0].split(",")
+            lines = lines[1:]
+        self._raw_lines = [line for line in lines if line.strip()]
+        self._rows = None
+        self._lazy_rows = {}
+        self._lazy_columns = {}
+        return True
+
+    def _parse_all(self) -> None:
+        """Materialize all deferred rows and release the raw line storage."""
+        self._rows = [list(map(float, line.split(","))) for line in self._raw_lines]
+        self._raw_lines = None
+        self._lazy_rows = None
+        self._lazy_columns = None
+        if self._rows:
+            self._ncols = len(self._rows[0])
 
     def __len__(self) -> int:
         """
@@ -32,14 +191,16 @@ class Csv:
         Returns:
             int: Number of rows.
         """
-        return len(self.rows)
+        if self._rows is None:
+            return len(self._raw_lines)
+        return len(self._rows)
 
-    def _load_csv(self, has_header=True):
+    def _load_csv(self):
         """
         Load a CSV file from the specified file path.
 
-        Args:
-            has_header (bool): Whether the file has a header row. Defaults to True.
+        Whether a header row is expected comes from the ``has_header``
+        flag given at construction time.
 
         Returns:
             tuple: A tuple (header, rows) where `header` is a list of column names (or None)
@@ -48,28 +209,321 @@ class Csv:
         Raises:
             ValueError: If rows cannot be converted to float.
         """
-        with open(self.file_path, newline="") as f:
-            reader = csv.reader(f)
-            if has_header:
-                self.header = next(reader)
-            rows = [list(map(float, row)) for row in reader]
-            return self.header, rows
+        has_header = self._has_header
+        # Accelerated backends only produce float cells, so typed schemas
+        # always take the stdlib path.
+        parsed = self._load_with_backend() if self.schema is None else None
+        if parsed is not None:
+            return parsed
+
+        # Pull the whole file into one string up front (mmap avoids an
+        # extra kernel-to-userspace copy for large files) so tokenizing is
+        # a couple of C-level str.split calls instead of a readline loop.
+        with open(self.file_path, "rb") as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = mm[:].decode()
+            except ValueError:  # empty files cannot be mmapped
+                data = f.read().decode()
+
+        # Sniff for quoted fields; only those need the full csv state
+        # machine. Plain numeric files take the str.split fast path,
+        # which skips per-field object churn inside csv.reader. The scan
+        # covers the whole blob — it is a single C-level pass, and a
+        # truncated window would misroute files whose first quoted field
+        # sits past it.
+        if '"' in data:
+            reader = csv.reader(io.StringIO(data))
+            header = next(reader) if has_header else None
+            if self.schema:
+                raw = list(reader)
+                convs = self._converters(header, len(raw[0]) if raw else 0)
+                rows = [[conv(fld) for conv, fld in zip(convs, row)] for row in raw]
+            else:
+                rows = [list(map(float, row)) for row in reader]
+            return header, rows
+
+        data = data.replace("\r\n", "\n")
+        if has_header:
+            header_end = data.find("\n")
+            if header_end == -1:
+                # Header-only file with no trailing newline: the whole
+                # blob is the header and there is no body to parse.
+                header = data.split(",") if data else None
+                body = ""
+            else:
+                header = data[:header_end].split(",")
+                body = data[header_end + 1:]
+        else:
+            header = None
+            body = data
+        if self.schema:
+            first_end = body.find("\n")
+            first_line = body[:first_end] if first_end != -1 else body
+            convs = self._converters(header, first_line.count(",") + 1)
+            rows = [
+                [conv(fld) for conv, fld in zip(convs, line.split(","))]
+                for line in body.split("\n")
+                if line.strip()
+            ]
+            return header, rows
+        try:
+            rows = _parse_numeric_blob(body)
+        except ValueError:
+            # Ragged rows (or a stray non-numeric field mid-file): fall back
+            # to line-at-a-time parsing, which reports the bad cell cleanly.
+            rows = [list(map(float, line.split(","))) for line in body.split("\n") if line.strip()]
+        return header, rows
+
+    def _converters(self, header, ncols):
+        """
+        Resolve the per-column converter list for this Csv's schema.
 
-    def add_row(self, row) -> None:
+        Args:
+            header (list or None): Column names, or None to key the schema
+                                   by column index.
+            ncols (int): Number of columns when there is no header.
+
+        Returns:
+            list: One converter callable per column; float where the
+                  schema does not say otherwise.
+        """
+        keys = header if header else range(ncols)
+        return [self.schema.get(key, float) for key in keys]
+
+    def _load_with_backend(self):
+        """
+        Try to parse the file with an optional accelerated backend.
+
+        Neither backend is a dependency of this project; each is used only
+        if the user already has it installed and asked for it (or left the
+        backend on "auto"). Under "auto", a backend that fails to parse
+        the file is skipped so loading degrades to the stdlib path, which
+        handles inputs (e.g. ragged rows) the accelerators reject; errors
+        propagate only for an explicitly requested backend.
+
+        Returns:
+            tuple or None: (header, rows) on success, or None if no
+                           accelerated backend is available.
+
+        Raises:
+            ImportError: If an explicitly requested backend is not installed.
+        """
+        if self.backend in ("native", "auto"):
+            # Hook for a locally compiled C/Cython parser. The project
+            # ships no build setup, so this only fires when a user has
+            # built data/_csv_fast themselves with the documented
+            # load_numeric(path, has_header) -> (header, rows) signature.
+            try:
+                from . import _csv_fast
+            except ImportError:
+                if self.backend == "native":
+                    raise ImportError(
+                        "backend 'native' was requested but no compiled data._csv_fast module was found"
+                    )
+            else:
+                try:
+                    return _csv_fast.load_numeric(self.file_path, self._has_header)
+                except Exception:
+                    if self.backend == "native":
+                        raise
+
+        if self.backend in ("cisv", "auto"):
+            try:
+                import cisv
+            except ImportError:
+                if self.backend == "cisv":
+                    raise ImportError("backend 'cisv' was requested but cisv is not installed")
+            else:
+                try:
+                    parsed = cisv.parse_file(self.file_path, parallel=True)
+                    header = parsed[0] if self._has_header else None
+                    rows = [list(map(float, row)) for row in parsed[1 if self._has_header else 0:]]
+                    return header, rows
+                except Exception:
+                    if self.backend == "cisv":
+                        raise
+
+        if self.backend in ("pyarrow", "auto"):
+            try:
+                import pyarrow.csv
+            except ImportError:
+                if self.backend == "pyarrow":
+                    raise ImportError(
+                        "backend 'pyarrow' was requested but pyarrow is not installed"
+                    )
+            else:
+                try:
+                    # Without this, pyarrow consumes the first data row as
+                    # column names on headerless files.
+                    read_options = None
+                    if not self._has_header:
+                        read_options = pyarrow.csv.ReadOptions(autogenerate_column_names=True)
+                    table = pyarrow.csv.read_csv(self.file_path, read_options=read_options)
+                    header = list(table.column_names) if self._has_header else None
+                    columns = [column.to_pylist() for column in table.columns]
+                    rows = [list(map(float, row)) for row in zip(*columns)]
+                    return header, rows
+                except Exception:
+                    if self.backend == "pyarrow":
+                        raise
+
+        return None
+
+    def add_row(self, row, dedup: bool = False) -> None:
         """
         Add a new row to the dataset.
 
         Args:
             row (list): A list of numeric values.
+            dedup (bool): If True, silently skip the row when an identical
+                          row already exists. Duplicate lookup is O(1) via
+                          a cached set of row keys. Defaults to False.
 
         Raises:
             ValueError: If the row length does not match existing rows.
         """
-        if len(row) != len(self.rows[0]):
+        ncols = self._column_count()
+        if ncols and len(row) != ncols:
             raise ValueError(
-                f"The new row's column count ({len(row)}) is different from the current data's column count ({len(self.rows[0])})"
+                f"The new row's column count ({len(row)}) is different from the current data's column count ({ncols})"
             )
+        if dedup:
+            if self._row_keys is None:
+                self._row_keys = {tuple(r) for r in self.rows}
+            key = tuple(row)
+            if key in self._row_keys:
+                return
+            self._row_keys.add(key)
+        elif self._row_keys is not None:
+            self._row_keys.add(tuple(row))
         self.rows.append(row)
+        self._ncols = len(row)
+        self._columns = None
+
+    def _column_count(self) -> int:
+        """
+        Number of columns in the dataset, cached after the first lookup.
+
+        Avoids re-deriving len(self.rows[0]) on every add_row call; the
+        cache also survives rows being assigned directly (as
+        train_test_split does), since it is computed lazily.
+
+        Returns:
+            int: Column count, or 0 for an empty dataset with no header.
+        """
+        if self._ncols is None:
+            if self.header:
+                self._ncols = len(self.header)
+            elif self._rows is None and self._raw_lines:
+                self._ncols = self._raw_lines[0].count(",") + 1
+            elif self._rows:
+                self._ncols = len(self._rows[0])
+            else:
+                return 0
+        return self._ncols
+
+    def add_rows(self, rows) -> None:
+        """
+        Add multiple rows to the dataset in one batch.
+
+        Validates every row up front, then appends them with a single
+        list.extend — one amortized reallocation for the whole batch
+        instead of per-call bookkeeping in a user-level add_row loop.
+
+        Args:
+            rows (iterable): An iterable of lists of numeric values.
+
+        Raises:
+            ValueError: If any row's length does not match existing rows.
+        """
+        rows = list(rows)
+        expected = self._column_count()
+        if expected:
+            for row in rows:
+                if len(row) != expected:
+                    raise ValueError(
+                        f"The new row's column count ({len(row)}) is different from the current data's column count ({expected})"
+                    )
+        self.rows.extend(rows)
+        if rows:
+            self._ncols = len(rows[0])
+        self._columns = None
+        self._row_keys = None
+
+    @property
+    def columns(self) -> dict:
+        """
+        Column-oriented view of the dataset (structure-of-arrays).
+
+        Each column is stored as a contiguous ``array`` of C doubles (or
+        C floats when the Csv was built with ``typecode="f"``), so
+        per-column math avoids the per-cell object overhead of the
+        row-oriented ``self.rows`` list. The view is built lazily on first
+        access and cached until the dataset is mutated.
+
+        Returns:
+            dict: Mapping of column name (or index if there is no header)
+                  to an ``array`` of that column's values.
+        """
+        if self._columns is None:
+            keys = self.header if self.header else range(len(self.rows[0]) if self.rows else 0)
+            typecode = self.typecode
+            columns = {}
+            for i, key in enumerate(keys):
+                try:
+                    columns[key] = array(typecode, (row[i] for row in self.rows))
+                except TypeError:
+                    # Non-numeric column (schema-typed str etc.): plain list.
+                    columns[key] = [row[i] for row in self.rows]
+            self._columns = columns
+        return self._columns
+
+    def __getitem__(self, name):
+        """
+        Column access by name (or index if there is no header).
+
+        Args:
+            name: Column name or index.
+
+        Returns:
+            The cached column container for that name.
+        """
+        return self.get_column(name)
+
+    def get_column(self, name):
+        """
+        Retrieve a single column as a contiguous array.
+
+        Args:
+            name: Column name (or index if there is no header).
+
+        Returns:
+            array: An ``array`` of this Csv's typecode holding the
+                   column's values.
+
+        Raises:
+            KeyError: If the column does not exist.
+        """
+        if self._rows is None:
+            # Deferred load: convert only the requested column, leaving
+            # every other cell unparsed.
+            column = self._lazy_columns.get(name)
+            if column is None:
+                if self.header:
+                    try:
+                        index = self.header.index(name)
+                    except ValueError:
+                        raise KeyError(name)
+                else:
+                    index = name
+                column = array(
+                    self.typecode,
+                    (float(line.split(",")[index]) for line in self._raw_lines),
+                )
+                self._lazy_columns[name] = column
+            return column
+        return self.columns[name]
 
     def get_row(self, index: int) -> list:
         """
@@ -81,6 +535,13 @@ class Csv:
         Returns:
             list: The row at the specified index.
         """
+        if self._rows is None:
+            # Deferred load: parse just this line and cache the result.
+            row = self._lazy_rows.get(index)
+            if row is None:
+                row = list(map(float, self._raw_lines[index].split(",")))
+                self._lazy_rows[index] = row
+            return row
         return self.rows[index]
 
     def visualize(self, row_start=None, row_end=None) -> None:
@@ -91,11 +552,16 @@ class Csv:
             row_start (int, optional): Starting row index. Defaults to None.
             row_end (int, optional): Ending row index (exclusive). Defaults to None.
         """
+        # Assemble the whole dump and emit it with one write: print()
+        # flushes and locks stdout per call, which dominates for large
+        # slices (especially when output is piped to a file).
+        out = []
+        join = " | ".join  # hoisted: one attribute lookup for the whole dump
         if self.header:
-            print(f"{' | '.join(self.header)}")
-            print("-" * (len(self.header) * 4))  # Simple separator based on header length
-        for row in self.rows[row_start:row_end]:
-            print(f"{' | '.join(map(str, row))}")
+            out.append(join(self.header))
+            out.append("-" * (len(self.header) * 4))  # Simple separator based on header length
+        out.extend(join(map(str, row)) for row in self.rows[row_start:row_end])
+        sys.stdout.write("\n".join(out) + "\n")
 
     def set_header(self, header: list) -> None:
         """
@@ -105,6 +571,7 @@ class Csv:
             header (list): A list of column names.
         """
         self.header = header
+        self._columns = None
 
     def get_header(self) -> list:
         """
@@ -140,18 +607,43 @@ class Csv:
         Args:
             output_path (str): Path to save the CSV file.
         """
-        with open(output_path, mode="w", newline="") as f:
-            writer = csv.writer(f)
-            if self.header:
+        # csv.writer's quoting is needed when the header contains
+        # delimiters, or when a schema allows non-float cells — those can
+        # hold arbitrary strings (e.g. "Doe, John") that the fast path
+        # would write unquoted. Purely numeric rows never need quoting.
+        needs_quoting = self.header and any("," in name or '"' in name for name in self.header)
+        if not needs_quoting and self.schema:
+            needs_quoting = any(conv is not float for conv in self.schema.values())
+        if needs_quoting:
+            with open(output_path, mode="w", newline="") as f:
+                writer = csv.writer(f)
                 writer.writerow(self.header)
-            writer.writerows(self.rows)
-
-    def sample(self, n: int) -> list:
+                writer.writerows(self.rows)
+            return
+
+        # Serialize everything into one growable byte buffer and issue a
+        # single binary write, instead of one writer.writerow call (and its
+        # quoting checks) per row. Accumulating bytes directly keeps peak
+        # memory at roughly the output size — no per-line string list plus
+        # a second full-size joined copy.
+        with open(output_path, mode="wb", buffering=1 << 20) as f:
+            buf = bytearray()
+            if self.header:
+                buf += ",".join(self.header).encode()
+                buf += b"\n"
+            for row in self.rows:
+                buf += ",".join(map(str, row)).encode()
+                buf += b"\n"
+            f.write(buf)
+
+    def sample(self, n: int, seed: int = None) -> list:
         """
         Return `n` random rows from the dataset.
 
         Args:
             n (int): Number of rows to sample.
+            seed (int, optional): Random seed for reproducibility.
+                                  Defaults to None.
 
         Returns:
             list: A list of sampled rows.
@@ -163,7 +655,12 @@ class Csv:
             raise ValueError(
                 f"Cannot sample more than the number of available rows ({len(self.rows)})"
             )
-        return random.sample(self.rows, n)
+        # Sample indices rather than rows: the sampling pool then holds n
+        # small ints instead of references into the (potentially huge) row
+        # lists, and the gather is a single comprehension.
+        rng = _rng if seed is None else random.Random(seed)
+        indices = rng.sample(range(len(self.rows)), n)
+        return [self.rows[i] for i in indices]
 
     def train_test_split(self, test_size: float = 0.2, seed: int = None):
         """
@@ -182,16 +679,18 @@ class Csv:
         if not (0 < test_size < 1):
             raise ValueError("test_size must be between 0 and 1.")
 
-        if seed is not None:
-            random.seed(seed)
+        # A dedicated Random instance keeps seeding local to this call
+        # instead of mutating the module-wide generator state.
+        rng = random.Random(seed)
 
-        # Make a copy of rows to avoid mutating the original data
-        shuffled_rows = self.rows[:]
-        random.shuffle(shuffled_rows)
+        # Permute indices rather than a full copy of the rows: one list of
+        # small ints is shuffled instead of a second row-reference list.
+        indices = list(range(len(self.rows)))
+        rng.shuffle(indices)
 
-        test_count = round(len(shuffled_rows) * test_size)
-        train_rows = shuffled_rows[test_count:]
-        test_rows = shuffled_rows[:test_count]
+        test_count = round(len(indices) * test_size)
+        train_rows = [self.rows[i] for i in indices[test_count:]]
+        test_rows = [self.rows[i] for i in indices[:test_count]]
 
         train_csv = Csv()
         if self.header:
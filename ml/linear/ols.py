@@ -216,23 +216,18 @@ class OrdinaryLeastSquares:
         X_arr = Array(X)
         # Create y as column vector: [[y1], [y2], ..., [yn]]
         y_arr = Array([[yi] for yi in y])
-        
+
         # Get dimensions
         n_samples, n_features = X_arr.shape()
-        
-        # Create intercept column (ones)
-        intercept_col = Array([[1.0] for _ in range(n_samples)])
-        
+
         # Add intercept column to X
-        X_with_intercept_data = []
-        for i in range(n_samples):
-            row = [1.0] + X_arr.data[i]  # Add intercept
-            X_with_intercept_data.append(row)
-        X_with_intercept = Array(X_with_intercept_data)
-        
+        X_with_intercept = Array([[1.0] + X_arr.data[i] for i in range(n_samples)])
+
         # Solve normal equation: β = (XᵀX)⁻¹Xᵀy
-        XtX = X_with_intercept.T().matmul(X_with_intercept)
-        Xty = X_with_intercept.T().matmul(y_arr)
+        # Transpose once and reuse it for both products.
+        Xt = X_with_intercept.T()
+        XtX = Xt.matmul(X_with_intercept)
+        Xty = Xt.matmul(y_arr)
         
         # Check for singularity
         try:
@@ -319,64 +314,51 @@ class OrdinaryLeastSquares:
         """
         # Convert to Array objects
         X_arr = Array(X)
-        y_arr = Array([[yi] for yi in y])
-        
+
         n_samples, n_features = X_arr.shape()
         tolerance = 1e-6
         max_iter = 1000
-        
-        # Initialize coefficients (non-negative) as list of lists
-        beta = [[0.0] for _ in range(n_features + 1)]  # +1 for intercept
-        
-        # Create X with intercept column
-        X_with_intercept_data = []
-        for i in range(n_samples):
-            row = [1.0] + X_arr.data[i]  # Add intercept
-            X_with_intercept_data.append(row)
-        X_with_intercept = Array(X_with_intercept_data)
-        
-        # Coordinate descent
+
+        # Precompute per-coordinate columns (with the intercept column of
+        # ones at index 0) and their squared norms once, instead of
+        # re-slicing the design matrix on every sweep.
+        columns = [[1.0] * n_samples] + [
+            [X_arr.data[i][j] for i in range(n_samples)] for j in range(n_features)
+        ]
+        col_norms_sq = [sum(v * v for v in col) for col in columns]
+
+        # Initialize coefficients (non-negative); beta = 0 means the full
+        # residual starts as y itself.
+        beta = [0.0] * (n_features + 1)  # +1 for intercept
+        residual = [float(yi) for yi in y]
+
+        # Coordinate descent. The residual vector is maintained
+        # incrementally: updating coordinate j by delta shifts the residual
+        # by -delta * Xj, so each coordinate update is O(n_samples) instead
+        # of recomputing the full prediction.
         for _ in range(max_iter):
-            beta_old = [row[:] for row in beta]
-            
+            max_change = 0.0
+
             for j in range(n_features + 1):  # Include intercept
-                # Compute residual excluding feature j
-                residual_data = []
-                for i in range(n_samples):
-                    pred = 0.0
-                    for k in range(n_features + 1):
-                        if k != j:
-                            pred += X_with_intercept.data[i][k] * beta[k][0]
-                    residual_data.append([y_arr.data[i][0] - pred])
-                residual = Array(residual_data)
-                
-                # Solve for coordinate j
-                xj_data = [[X_with_intercept.data[i][j]] for i in range(n_samples)]
-                xj = Array(xj_data)
-                
-                # Compute Xj^T * residual and ||Xj||²
-                xj_t_residual = 0.0
-                xj_norm_sq = 0.0
-                for i in range(n_samples):
-                    xj_t_residual += xj.data[i][0] * residual.data[i][0]
-                    xj_norm_sq += xj.data[i][0] ** 2
-                
-                if xj_norm_sq > 1e-12:  # Avoid division by zero
-                    beta_j_new = max(0.0, xj_t_residual / xj_norm_sq)
-                else:
-                    beta_j_new = 0.0
-                
-                beta[j][0] = beta_j_new
-            
-            # Check convergence (simple check)
-            converged = True
-            for i in range(len(beta)):
-                if abs(beta[i][0] - beta_old[i][0]) > tolerance:
-                    converged = False
-                    break
-            if converged:
+                norm_sq = col_norms_sq[j]
+                if norm_sq <= 1e-12:  # Avoid division by zero
+                    continue
+                col = columns[j]
+
+                # Xjᵀ(residual excluding j) = Xjᵀ residual + βj ||Xj||²
+                gradient = sum(c * r for c, r in zip(col, residual)) + beta[j] * norm_sq
+                beta_j_new = max(0.0, gradient / norm_sq)
+
+                delta = beta_j_new - beta[j]
+                if delta:
+                    for i, c in enumerate(col):
+                        residual[i] -= delta * c
+                    beta[j] = beta_j_new
+                    max_change = max(max_change, abs(delta))
+
+            if max_change <= tolerance:
                 break
-        
+
         # Extract coefficients and intercept
-        self.intercept = beta[0][0]
-        self.coefficients = [beta[i][0] for i in range(1, len(beta))]
+        self.intercept = beta[0]
+        self.coefficients = beta[1:]
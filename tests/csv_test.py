@@ -21,6 +21,16 @@ class TestCsv(unittest.TestCase):
             writer.writerows(
                 [[1.1, 2.2, 3.3], [4.4, 5.5, 6.6], [7.7, 8.8, 9.9], [10.1, 11.1, 12.1]]
             )
+        # Parse once; each test works on a cheap copy instead of re-reading
+        # and re-parsing the file (see _fresh below).
+        cls._template = Csv(cls.test_file)
+
+    def _fresh(self):
+        """Return a fresh Csv copied from the template parsed in setUpClass."""
+        csv_obj = Csv()
+        csv_obj.header = list(self._template.header)
+        csv_obj.rows = [row[:] for row in self._template.rows]
+        return csv_obj
 
     @classmethod
     def tearDownClass(cls):
@@ -37,7 +47,7 @@ class TestCsv(unittest.TestCase):
 
     def test_add_row(self):
         """Test adding a valid row and raising an error for invalid row."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         new_row = [10.1, 11.1, 12.1]
         csv_obj.add_row(new_row)
         self.assertEqual(len(csv_obj), 5)  # Should have 5 rows after adding
@@ -46,40 +56,40 @@ class TestCsv(unittest.TestCase):
 
     def test_get_row(self):
         """Test retrieving a specific row."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         row = csv_obj.get_row(1)
         self.assertEqual(row, [4.4, 5.5, 6.6])  # Row at index 1 should match
 
     def test_visualize(self):
         """Test visualize function."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         csv_obj.visualize(row_start=1, row_end=2)  # Should print rows 1 to 2
 
     def test_set_header(self):
         """Test setting a new header."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         new_header = ["Col1", "Col2", "Col3"]
         csv_obj.set_header(new_header)
         self.assertEqual(csv_obj.get_header(), new_header)
 
     def test_get_header(self):
         """Test getting the header."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         self.assertEqual(csv_obj.get_header(), ["Header1", "Header2", "Header3"])
 
     def test_head(self):
         """Test getting the first n rows."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         csv_obj.head(2)  # Should print first 2 rows
 
     def test_tail(self):
         """Test getting the last n rows."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         csv_obj.tail(2)  # Should print last 2 rows
 
     def test_save(self):
         """Test saving to a new CSV file."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
         csv_obj.save("test_output.csv")
 
         # Verify that the file is created and the content matches
@@ -100,9 +110,108 @@ class TestCsv(unittest.TestCase):
             ],
         )
 
+    def test_add_row_dedup(self):
+        """Test that dedup skips rows identical to an existing one."""
+        csv_obj = self._fresh()
+        csv_obj.add_row([1.1, 2.2, 3.3], dedup=True)  # Duplicate of row 0
+        self.assertEqual(len(csv_obj), 4)
+        csv_obj.add_row([13.1, 14.1, 15.1], dedup=True)
+        self.assertEqual(len(csv_obj), 5)
+
+    def test_add_rows(self):
+        """Test adding a batch of rows and validating their widths."""
+        csv_obj = self._fresh()
+        csv_obj.add_rows([[13.1, 14.1, 15.1], [16.1, 17.1, 18.1]])
+        self.assertEqual(len(csv_obj), 6)
+        self.assertEqual(csv_obj.get_row(5), [16.1, 17.1, 18.1])
+        with self.assertRaises(ValueError):
+            csv_obj.add_rows([[1.0, 2.0, 3.0], [4.0, 5.0]])  # Ragged batch
+
+    def test_columns(self):
+        """Test the column-oriented view and column access."""
+        csv_obj = self._fresh()
+        columns = csv_obj.columns
+        self.assertEqual(list(columns["Header2"]), [2.2, 5.5, 8.8, 11.1])
+        self.assertEqual(list(csv_obj.get_column("Header1")), [1.1, 4.4, 7.7, 10.1])
+        self.assertEqual(list(csv_obj["Header3"]), [3.3, 6.6, 9.9, 12.1])
+        with self.assertRaises(KeyError):
+            csv_obj.get_column("NoSuchColumn")
+
+    def test_lazy_load(self):
+        """Test deferred parsing: rows materialize only on first access."""
+        csv_obj = Csv(self.test_file, lazy=True)
+        self.assertEqual(len(csv_obj), 4)  # Row count known before parsing
+        self.assertEqual(csv_obj.get_row(1), [4.4, 5.5, 6.6])
+        self.assertEqual(csv_obj.get_row(1), [4.4, 5.5, 6.6])  # Cached path
+        self.assertEqual(list(csv_obj.get_column("Header2")), [2.2, 5.5, 8.8, 11.1])
+        with self.assertRaises(KeyError):
+            csv_obj.get_column("NoSuchColumn")
+        # First .rows access parses the whole file and matches the eager load
+        self.assertEqual(csv_obj.rows, self._template.rows)
+        self.assertEqual(csv_obj.header, self._template.header)
+
+    def test_schema_round_trip(self):
+        """Test typed columns via schema, including cells with delimiters."""
+        schema_file = "test_schema.csv"
+        with open(schema_file, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["name", "score"])
+            writer.writerows([["Doe, John", 1.5], ["Jane", 2.5]])
+        try:
+            csv_obj = Csv(schema_file, schema={"name": str})
+            self.assertEqual(csv_obj.rows, [["Doe, John", 1.5], ["Jane", 2.5]])
+            csv_obj.save("test_output.csv")
+            reloaded = Csv("test_output.csv", schema={"name": str})
+            self.assertEqual(reloaded.header, csv_obj.header)
+            self.assertEqual(reloaded.rows, csv_obj.rows)
+        finally:
+            os.remove(schema_file)
+
+    def test_has_header_false(self):
+        """Test loading a file without a header row."""
+        headerless_file = "test_headerless.csv"
+        with open(headerless_file, "w") as f:
+            f.write("1.0,2.0\n3.0,4.0\n")
+        try:
+            csv_obj = Csv(headerless_file, has_header=False)
+            self.assertIsNone(csv_obj.header)
+            self.assertEqual(csv_obj.rows, [[1.0, 2.0], [3.0, 4.0]])
+            self.assertEqual(list(csv_obj.get_column(1)), [2.0, 4.0])
+        finally:
+            os.remove(headerless_file)
+
+    def test_invalid_options(self):
+        """Test that bad typecode or backend names are rejected."""
+        with self.assertRaises(ValueError):
+            Csv(typecode="q")
+        with self.assertRaises(ValueError):
+            Csv(backend="nonsense")
+
+    def test_malformed_files(self):
+        """Test that ragged and bad-cell files match line-by-line parsing."""
+        malformed_file = "test_malformed.csv"
+        try:
+            with open(malformed_file, "w") as f:
+                f.write("a,b,c\n1,2,3\n4,5\n6\n")  # Ragged rows preserved
+            self.assertEqual(Csv(malformed_file).rows, [[1.0, 2.0, 3.0], [4.0, 5.0], [6.0]])
+            with open(malformed_file, "w") as f:
+                f.write("a,b\n1,2\n3\n4,5,6\n")  # Ragged but compensating total
+            self.assertEqual(Csv(malformed_file).rows, [[1.0, 2.0], [3.0], [4.0, 5.0, 6.0]])
+            with open(malformed_file, "w") as f:
+                f.write("a,b,c\n1,,\n,2,3\n")  # Empty fields must raise
+            with self.assertRaises(ValueError):
+                Csv(malformed_file)
+            with open(malformed_file, "w") as f:
+                f.write("a,b,c")  # Header-only file, no trailing newline
+            csv_obj = Csv(malformed_file)
+            self.assertEqual(csv_obj.header, ["a", "b", "c"])
+            self.assertEqual(csv_obj.rows, [])
+        finally:
+            os.remove(malformed_file)
+
     def test_train_test_split(self):
         """Test train-test split functionality."""
-        csv_obj = Csv(self.test_file)
+        csv_obj = self._fresh()
 
         # Test with 50% split and a fixed seed for reproducibility
         train_csv, test_csv = csv_obj.train_test_split(test_size=0.5, seed=42)
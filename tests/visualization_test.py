@@ -10,6 +10,7 @@ from visualization.ppm.ppm import PPMImage
 from visualization.plot.scatter import Scatter
 from visualization.plot.line import Line
 from visualization.plot.font import FontEngine
+from visualization.plot._kernels import clip_segment
 
 
 class TestPPMImage(unittest.TestCase):
@@ -23,13 +24,53 @@ class TestPPMImage(unittest.TestCase):
 
     def test_set_pixel(self):
         self.img.set_pixel(5, 5, (0, 0, 0))
-        self.assertEqual(self.img.pixels[5][5], (0, 0, 0))
+        self.assertEqual(self.img.get_pixel(5, 5), (0, 0, 0))
 
     def test_save_file_exists(self):
         self.img.set_pixel(1, 1, (123, 123, 123))
         self.img.save(self.test_file)
         self.assertTrue(os.path.exists(self.test_file))
 
+    def test_save_formats(self):
+        self.img.save(self.test_file, fmt="P3")
+        with open(self.test_file) as f:
+            self.assertEqual(f.readline().strip(), "P3")
+        self.img.save(self.test_file)  # P6 default
+        with open(self.test_file, "rb") as f:
+            self.assertEqual(f.readline().strip(), b"P6")
+        with self.assertRaises(ValueError):
+            self.img.save(self.test_file, fmt="P9")
+
+    def test_hline(self):
+        self.img.hline(3, 2, 7, color=(255, 0, 0))
+        self.assertEqual(self.img.get_pixel(2, 3), (255, 0, 0))
+        self.assertEqual(self.img.get_pixel(7, 3), (255, 0, 0))  # Inclusive end
+        self.assertEqual(self.img.get_pixel(8, 3), (255, 255, 255))
+
+    def test_vline(self):
+        self.img.vline(4, 1, 6, color=(0, 255, 0))
+        self.assertEqual(self.img.get_pixel(4, 1), (0, 255, 0))
+        self.assertEqual(self.img.get_pixel(4, 6), (0, 255, 0))  # Inclusive end
+        self.assertEqual(self.img.get_pixel(4, 7), (255, 255, 255))
+
+    def test_draw_dots(self):
+        self.img.draw_dots([(2, 2), (8, 8)], radius=1, color=(0, 0, 255))
+        self.assertEqual(self.img.get_pixel(2, 2), (0, 0, 255))
+        self.assertEqual(self.img.get_pixel(1, 1), (0, 0, 255))  # Radius covers it
+        self.assertEqual(self.img.get_pixel(8, 8), (0, 0, 255))
+        self.assertEqual(self.img.get_pixel(5, 5), (255, 255, 255))
+
+
+class TestClipSegment(unittest.TestCase):
+    def test_inside_segment_unchanged(self):
+        self.assertEqual(clip_segment(2, 2, 8, 8, 0, 0, 10, 10), (2, 2, 8, 8))
+
+    def test_outside_segment_rejected(self):
+        self.assertIsNone(clip_segment(-5, -5, -1, -1, 0, 0, 10, 10))
+
+    def test_crossing_segment_clipped(self):
+        self.assertEqual(clip_segment(-5, 5, 15, 5, 0, 0, 10, 10), (0, 5, 10, 5))
+
 
 class TestScatterPlot(unittest.TestCase):
     def setUp(self):
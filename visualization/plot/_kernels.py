@@ -0,0 +1,164 @@
+"""
+Rasterization Kernels Module
+
+The hot pixel-level kernels behind the plot renderers: span filling,
+thick Bresenham line stepping, and Cohen-Sutherland segment clipping.
+They live in one module so the renderers stay free of inner-loop code
+and so a compiled drop-in can replace them wholesale: if a module named
+``visualization.plot._kernels_native`` exporting the same callables is
+importable, its versions are used instead. This project ships no build
+scaffolding — the pure-Python kernels are always present and are the
+default.
+"""
+
+_INSIDE, _LEFT, _RIGHT, _BOTTOM, _TOP = 0, 1, 2, 4, 8
+
+
+def fill_span(pixels, row_bytes, width, height, color_bytes, rx0, rx1, ry0, ry1):
+    """
+    Fill the clamped rectangle [rx0, rx1) x [ry0, ry1) with one color run
+    per covered row.
+    """
+    if rx0 < 0:
+        rx0 = 0
+    if rx1 > width:
+        rx1 = width
+    if ry0 < 0:
+        ry0 = 0
+    if ry1 > height:
+        ry1 = height
+    if rx0 >= rx1:
+        return
+    run = color_bytes * (rx1 - rx0)
+    for row in range(ry0, ry1):
+        start = row * row_bytes + rx0 * 3
+        pixels[start:start + len(run)] = run
+
+
+def bresenham(image, x0, y0, x1, y1, radius, color):
+    """
+    Rasterize a thick line segment directly into the image byte buffer.
+
+    A module-level kernel with everything bound to locals: the Bresenham
+    stepping runs without per-pixel method dispatch, and thickness is
+    applied one strip per same-row run — consecutive steps that stay on
+    one row are flushed as a single rectangle, whose fill equals the
+    union of the per-pixel thickness squares it replaces.
+
+    Args:
+        image (PPMImage): Target image.
+        x0, y0: Starting pixel coordinates.
+        x1, y1: Ending pixel coordinates.
+        radius (int): Half-thickness of the line in pixels.
+        color (tuple): RGB color tuple.
+    """
+    width = image.width
+    height = image.height
+    pixels = image.pixels
+    row_bytes = width * 3
+    color_bytes = bytes(color)
+
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    run_x0 = x0  # leftmost/rightmost pixel of the current same-row run
+
+    while True:
+        if x0 == x1 and y0 == y1:
+            left = run_x0 if run_x0 < x0 else x0
+            right = run_x0 if run_x0 > x0 else x0
+            fill_span(pixels, row_bytes, width, height, color_bytes,
+                      left - radius, right + radius + 1,
+                      y0 - radius, y0 + radius + 1)
+            break
+        e2 = 2 * err
+        nx, ny = x0, y0
+        if e2 >= dy:
+            err += dy
+            nx += sx
+        if e2 <= dx:
+            err += dx
+            ny += sy
+        if ny != y0:
+            # Row change: flush the strip accumulated on the current row.
+            left = run_x0 if run_x0 < x0 else x0
+            right = run_x0 if run_x0 > x0 else x0
+            fill_span(pixels, row_bytes, width, height, color_bytes,
+                      left - radius, right + radius + 1,
+                      y0 - radius, y0 + radius + 1)
+            run_x0 = nx
+        x0, y0 = nx, ny
+
+
+def _outcode(x, y, xmin, ymin, xmax, ymax):
+    """Cohen-Sutherland region code for a point against a clip rect."""
+    code = _INSIDE
+    if x < xmin:
+        code |= _LEFT
+    elif x > xmax:
+        code |= _RIGHT
+    if y < ymin:
+        code |= _BOTTOM
+    elif y > ymax:
+        code |= _TOP
+    return code
+
+
+def clip_segment(x0, y0, x1, y1, xmin, ymin, xmax, ymax):
+    """
+    Clip a segment to an inclusive rectangle with Cohen-Sutherland.
+
+    Segments fully inside the rectangle — the normal case, since data is
+    scaled into the plot area — cost two region codes and return
+    unchanged. Segments fully outside are rejected before Bresenham
+    iterates a single pixel.
+
+    Args:
+        x0, y0: Starting pixel coordinates.
+        x1, y1: Ending pixel coordinates.
+        xmin, ymin, xmax, ymax: Clip rectangle bounds (inclusive).
+
+    Returns:
+        tuple or None: Clipped (x0, y0, x1, y1), or None if the segment
+        lies entirely outside the rectangle.
+    """
+    code0 = _outcode(x0, y0, xmin, ymin, xmax, ymax)
+    code1 = _outcode(x1, y1, xmin, ymin, xmax, ymax)
+
+    while True:
+        if not (code0 | code1):
+            return x0, y0, x1, y1
+        if code0 & code1:
+            return None
+
+        # Pick an endpoint outside the rect and move it to the boundary
+        # it crosses; the segment is unchanged as a set of points.
+        code_out = code0 or code1
+        if code_out & _TOP:
+            x = x0 + (x1 - x0) * (ymax - y0) / (y1 - y0)
+            y = ymax
+        elif code_out & _BOTTOM:
+            x = x0 + (x1 - x0) * (ymin - y0) / (y1 - y0)
+            y = ymin
+        elif code_out & _RIGHT:
+            y = y0 + (y1 - y0) * (xmax - x0) / (x1 - x0)
+            x = xmax
+        else:
+            y = y0 + (y1 - y0) * (xmin - x0) / (x1 - x0)
+            x = xmin
+
+        if code_out == code0:
+            x0, y0 = round(x), round(y)
+            code0 = _outcode(x0, y0, xmin, ymin, xmax, ymax)
+        else:
+            x1, y1 = round(x), round(y)
+            code1 = _outcode(x1, y1, xmin, ymin, xmax, ymax)
+
+
+try:
+    # Optional user-compiled kernels, mirroring the data._csv_fast hook.
+    from ._kernels_native import fill_span, bresenham, clip_segment  # noqa: F401,F811
+except ImportError:
+    pass
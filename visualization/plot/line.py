@@ -11,6 +11,7 @@ All drawing operations are pixel-based using PPMImage and text is rendered using
 """
 
 from .plot import Plot
+from ._kernels import bresenham, clip_segment
 
 
 class Line(Plot):
@@ -88,92 +89,29 @@ class Line(Plot):
         self.range_y = None
         self.min_x = None
         self.min_y = None
+        self.max_x = None
+        self.max_y = None
 
-    def render(self):
-        """
-        Render the line plot.
-
-        Computes scaling and dimensions, then draws:
-        - Axes
-        - Connecting lines
-        - Labels
-        - Tick marks
-        """
-        if len(self.x_data) != len(self.y_data):
-            raise ValueError("x_data and y_data must be the same length")
-
-        self.plot_w = self.width - 2 * self.margin
-        self.plot_h = self.height - 2 * self.margin
-
-        self.min_x, max_x = min(self.x_data), max(self.x_data)
-        self.min_y, max_y = min(self.y_data), max(self.y_data)
-
-        self.range_x = max_x - self.min_x or 1
-        self.range_y = max_y - self.min_y or 1
-
+    def _draw_data(self):
+        """Draw the data layer: lines connecting the data points."""
         self._draw_lines()
 
-        # Draw axes
-        for i in range(self.plot_w + 1):
-            self.image.set_pixel(self.margin + i, self.height - self.margin, (0, 0, 0))
-        for i in range(self.plot_h + 1):
-            self.image.set_pixel(self.margin, self.height - self.margin - i, (0, 0, 0))
-
-        # Title
-        if self.title:
-            self.font.draw_text(
-                self.image,
-                self.width // 2 - len(self.title) * 6 // 2,
-                10,
-                self.title,
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # X-axis label
-        if self.x_label:
-            self.font.draw_text(
-                self.image,
-                self.width // 2 - len(self.x_label) * 6 // 2,
-                self.height - 25,
-                self.x_label,
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # Y-axis label
-        if self.y_label:
-            self.font.draw_text(
-                self.image,
-                5,
-                self.margin,
-                self.y_label[:10],
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # Tick marks
-        if self.x_ticks:
-            self.draw_x_ticks(
-                self.min_x, self.min_x + self.range_x, self.x_ticks, self.margin, self.plot_w
-            )
-        if self.y_ticks:
-            self.draw_y_ticks(
-                self.min_y, self.min_y + self.range_y, self.y_ticks, self.margin, self.plot_h
-            )
-
     def _draw_lines(self):
         """
         Draw lines connecting the data points.
 
         Uses scaled coordinates and Bresenham’s line algorithm to rasterize lines.
         """
-        pixel_coords = []
-        for x, y in zip(self.x_data, self.y_data):
-            px = int((x - self.min_x) / self.range_x * self.plot_w) + self.margin
-            py = int((y - self.min_y) / self.range_y * self.plot_h)
-            py = self.height - py - self.margin
-            pixel_coords.append((px, py))
+        # Hoist the scale factors and attribute lookups out of the
+        # per-point transform; each point is then one multiply per axis.
+        scale_x = self.plot_w / self.range_x
+        scale_y = self.plot_h / self.range_y
+        min_x, min_y = self.min_x, self.min_y
+        margin, height = self.margin, self.height
+        pixel_coords = [
+            (int((x - min_x) * scale_x) + margin, height - int((y - min_y) * scale_y) - margin)
+            for x, y in zip(self.x_data, self.y_data)
+        ]
 
         for (x0, y0), (x1, y1) in zip(pixel_coords[:-1], pixel_coords[1:]):
             self._draw_line(x0, y0, x1, y1)
@@ -182,24 +120,20 @@ class Line(Plot):
         """
         Draw a line between two pixels using Bresenham's algorithm.
 
+        The segment is clipped to the plot rectangle first, so segments
+        from out-of-range data never rasterize pixels that would be
+        discarded anyway.
+
         Args:
             x0, y0: Starting pixel coordinates.
             x1, y1: Ending pixel coordinates.
         """
-        dx = abs(x1 - x0)
-        dy = -abs(y1 - y0)
-        sx = 1 if x0 < x1 else -1
-        sy = 1 if y0 < y1 else -1
-        err = dx + dy
-
-        while True:
-            self.image.draw_dot(x0, y0, radius=self.line_thickness, color=self.color)
-            if x0 == x1 and y0 == y1:
-                break
-            e2 = 2 * err
-            if e2 >= dy:
-                err += dy
-                x0 += sx
-            if e2 <= dx:
-                err += dx
-                y0 += sy
+        clipped = clip_segment(
+            x0, y0, x1, y1,
+            self.margin, self.height - self.margin - self.plot_h,
+            self.margin + self.plot_w, self.height - self.margin,
+        )
+        if clipped is None:
+            return
+        x0, y0, x1, y1 = clipped
+        bresenham(self.image, x0, y0, x1, y1, self.line_thickness, self.color)
@@ -1,19 +1,139 @@
+import functools
 from abc import ABC, abstractmethod
 from visualization.ppm.ppm import PPMImage
 from .font import FontEngine
 
 
+@functools.cache
+def _get_font():
+    """Process-wide FontEngine instance; it is read-only after init."""
+    return FontEngine()
+
+
+#: Rendered chrome layers (background, axes, title, labels, ticks) keyed
+#: by everything they depend on. Re-rendering the same chart shell with
+#: new data — live plots, parameter sweeps — restores the chrome with one
+#: buffer copy instead of redrawing it. The key includes the data bounds
+#: (tick positions depend on them), so sweeps with changing bounds miss
+#: every frame; the cache is a small LRU so misses evict the oldest
+#: snapshot instead of retaining a full-frame buffer per render.
+_chrome_cache = {}
+_CHROME_CACHE_SIZE = 8
+
+
 class Plot(ABC):
     def __init__(self, width=400, height=400, background=(255, 255, 255)):
         self.width = width
         self.height = height
         self.background = background
         self.image = PPMImage(width, height, background)
-        self.font = FontEngine()
+        self.font = _get_font()
 
-    @abstractmethod
     def render(self):
-        pass
+        """
+        Render the plot.
+
+        Computes scaling and dimensions, restores or draws the chrome —
+        background, axes, title, labels, tick marks — then draws the
+        subclass data via _draw_data on top. The chrome depends only on
+        the chart shell, not on the data points, so it is rendered once
+        per shell and restored from _chrome_cache afterwards.
+        """
+        self._compute_ranges()
+
+        key = (
+            self.width, self.height, self.background, self.margin,
+            self.title, self.x_label, self.y_label,
+            tuple(self.x_ticks) if self.x_ticks else (),
+            tuple(self.y_ticks) if self.y_ticks else (),
+            self.min_x, self.max_x, self.min_y, self.max_y,
+        )
+        chrome = _chrome_cache.get(key)
+        if chrome is None:
+            self.image.pixels[:] = bytes(self.background) * (self.width * self.height)
+            self._draw_chrome()
+            _chrome_cache[key] = bytes(self.image.pixels)
+            if len(_chrome_cache) > _CHROME_CACHE_SIZE:
+                del _chrome_cache[next(iter(_chrome_cache))]
+        else:
+            # Move the hit to the end so eviction drops the least
+            # recently used shell.
+            _chrome_cache[key] = _chrome_cache.pop(key)
+            self.image.pixels[:] = chrome
+
+        self._draw_data()
+
+    def _draw_chrome(self):
+        """Draw the data-independent layer: axes, title, labels, ticks."""
+        # Draw X and Y axes
+        self.image.hline(self.height - self.margin, self.margin, self.margin + self.plot_w)
+        self.image.vline(self.margin, self.height - self.margin - self.plot_h, self.height - self.margin)
+
+        # Title
+        if self.title:
+            self.font.draw_text(
+                self.image,
+                self.width // 2 - self.font.text_width(self.title) // 2,
+                10,
+                self.title,
+                color=(0, 0, 0),
+                scale=1,
+            )
+
+        # X-axis label
+        if self.x_label:
+            self.font.draw_text(
+                self.image,
+                self.width // 2 - self.font.text_width(self.x_label) // 2,
+                self.height - 25,
+                self.x_label,
+                color=(0, 0, 0),
+                scale=1,
+            )
+
+        # Y-axis label (not rotated)
+        if self.y_label:
+            self.font.draw_text(
+                self.image,
+                5,
+                self.margin,
+                self.y_label[:10],
+                color=(0, 0, 0),
+                scale=1,
+            )
+
+        # Tick marks
+        if self.x_ticks:
+            self.draw_x_ticks(self.min_x, self.max_x, self.x_ticks, self.margin, self.plot_w)
+        if self.y_ticks:
+            self.draw_y_ticks(self.min_y, self.max_y, self.y_ticks, self.margin, self.plot_h)
+
+    @abstractmethod
+    def _draw_data(self):
+        """Draw the data layer of the plot. Implemented by subclasses."""
+
+    def _compute_ranges(self):
+        """
+        Compute data bounds and plot dimensions once per render.
+
+        min()/max() already run as C loops over the data; the point is to
+        take each pass exactly once and keep the maxima around, so neither
+        the subclasses nor the tick drawing re-derive them.
+
+        Raises:
+            ValueError: If x_data and y_data lengths differ.
+        """
+        if len(self.x_data) != len(self.y_data):
+            raise ValueError("x_data and y_data must be the same length")
+
+        self.plot_w = self.width - 2 * self.margin
+        self.plot_h = self.height - 2 * self.margin
+
+        self.min_x, self.max_x = min(self.x_data), max(self.x_data)
+        self.min_y, self.max_y = min(self.y_data), max(self.y_data)
+
+        self.range_x = self.max_x - self.min_x or 1
+        self.range_y = self.max_y - self.min_y or 1
 
     def save(self, path: str):
         self.image.save(path)
@@ -32,12 +152,14 @@ class Plot(ABC):
             margin (int): Margin space around plot.
             plot_width (int): Width of the plot area.
         """
-        range_val = max_val - min_val or 1
-        for tick in tick_values:
-            px = int((tick - min_val) / range_val * plot_width) + margin
-            self.font.draw_text(
-                self.image, px - 5, self.height - margin + 5, str(tick), color=(0, 0, 0), scale=1
-            )
+        # Tick position is a linear function of tick value: hoist the
+        # scale and materialize positions and labels before drawing, so
+        # the loop body is only the text blits.
+        scale = plot_width / (max_val - min_val or 1)
+        labeled = [(int((tick - min_val) * scale) + margin, str(tick)) for tick in tick_values]
+        ty = self.height - margin + 5
+        for px, label in labeled:
+            self.font.draw_text(self.image, px - 5, ty, label, color=(0, 0, 0), scale=1)
 
     def draw_y_ticks(self, min_val, max_val, tick_values, margin, plot_height):
         """
@@ -50,8 +172,8 @@ class Plot(ABC):
             margin (int): Margin space around plot.
             plot_height (int): Height of the plot area.
         """
-        range_val = max_val - min_val or 1
-        for tick in tick_values:
-            py = int((tick - min_val) / range_val * plot_height)
-            py = self.height - py - margin
-            self.font.draw_text(self.image, 10, py - 3, str(tick), color=(0, 0, 0), scale=1)
+        scale = plot_height / (max_val - min_val or 1)
+        base = self.height - margin
+        labeled = [(base - int((tick - min_val) * scale), str(tick)) for tick in tick_values]
+        for py, label in labeled:
+            self.font.draw_text(self.image, 10, py - 3, label, color=(0, 0, 0), scale=1)
@@ -13,6 +13,11 @@ All drawing operations are pixel-based using PPMImage and text is rendered using
 
 from .plot import Plot
 
+#: Point count above which uniform-color scatters deduplicate coincident
+#: pixel coordinates before stamping; below it the set build costs more
+#: than the redundant fills it saves.
+_DEDUP_THRESHOLD = 10_000
+
 
 class Scatter(Plot):
     """
@@ -104,90 +109,42 @@ class Scatter(Plot):
         self.range_y = None
         self.min_x = None
         self.min_y = None
+        self.max_x = None
+        self.max_y = None
 
-    def render(self):
-        """
-        Render the scatter plot.
-
-        Computes scaling and dimensions, then draws:
-        - Axes
-        - Dots
-        - Labels
-        - Tick marks
-        """
-        if len(self.x_data) != len(self.y_data):
-            raise ValueError("x_data and y_data must be the same length")
-
-        self.plot_w = self.width - 2 * self.margin
-        self.plot_h = self.height - 2 * self.margin
-
-        self.min_x, max_x = min(self.x_data), max(self.x_data)
-        self.min_y, max_y = min(self.y_data), max(self.y_data)
-
-        self.range_x = max_x - self.min_x or 1
-        self.range_y = max_y - self.min_y or 1
-
+    def _draw_data(self):
+        """Draw the data layer: one dot per data point."""
         self._draw_points()
 
-        # Draw X and Y axes
-        for i in range(self.plot_w + 1):
-            self.image.set_pixel(self.margin + i, self.height - self.margin, (0, 0, 0))
-        for i in range(self.plot_h + 1):
-            self.image.set_pixel(self.margin, self.height - self.margin - i, (0, 0, 0))
-
-        # Title
-        if self.title:
-            self.font.draw_text(
-                self.image,
-                self.width // 2 - len(self.title) * 6 // 2,
-                10,
-                self.title,
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # X-axis label
-        if self.x_label:
-            self.font.draw_text(
-                self.image,
-                self.width // 2 - len(self.x_label) * 6 // 2,
-                self.height - 25,
-                self.x_label,
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # Y-axis label (not rotated)
-        if self.y_label:
-            self.font.draw_text(
-                self.image,
-                5,
-                self.margin,
-                self.y_label[:10],
-                color=(0, 0, 0),
-                scale=1,
-            )
-
-        # Tick marks
-        if self.x_ticks:
-            self.draw_x_ticks(
-                self.min_x, self.min_x + self.range_x, self.x_ticks, self.margin, self.plot_w
-            )
-        if self.y_ticks:
-            self.draw_y_ticks(
-                self.min_y, self.min_y + self.range_y, self.y_ticks, self.margin, self.plot_h
-            )
-
     def _draw_points(self):
         """
         Plot all data points as filled circles on the canvas.
         Uses scaled coordinates and handles custom per-point colors.
         """
-        for i, (x, y) in enumerate(zip(self.x_data, self.y_data)):
-            px = int((x - self.min_x) / self.range_x * self.plot_w) + self.margin
-            py = int((y - self.min_y) / self.range_y * self.plot_h)
-            py = self.height - py - self.margin
-            dot_color = (
-                self.dot_colors[i] if self.dot_colors and i < len(self.dot_colors) else self.color
-            )
-            self.image.draw_dot(px, py, radius=self.point_size, color=dot_color)
+        # Hoist the scale factors and attribute lookups out of the
+        # per-point transform; each point is then one multiply per axis.
+        scale_x = self.plot_w / self.range_x
+        scale_y = self.plot_h / self.range_y
+        min_x, min_y = self.min_x, self.min_y
+        margin, height = self.margin, self.height
+        pixel_coords = [
+            (int((x - min_x) * scale_x) + margin, height - int((y - min_y) * scale_y) - margin)
+            for x, y in zip(self.x_data, self.y_data)
+        ]
+
+        dot_colors = self.dot_colors
+        if not dot_colors:
+            # Uniform color: one batched call prepares the color run once
+            # and stamps every point from it. Dense scatters map many
+            # points onto the same pixel; past the threshold it is cheaper
+            # to stamp each covered pixel once than to redo the fill per
+            # coincident point.
+            if len(pixel_coords) > _DEDUP_THRESHOLD:
+                pixel_coords = set(pixel_coords)
+            self.image.draw_dots(pixel_coords, radius=self.point_size, color=self.color)
+            return
+
+        draw_dot = self.image.draw_dot
+        for i, (px, py) in enumerate(pixel_coords):
+            dot_color = dot_colors[i] if i < len(dot_colors) else self.color
+            draw_dot(px, py, radius=self.point_size, color=dot_color)
@@ -22,7 +22,10 @@ class PPMImage:
         self.width = width
         self.height = height
         self.bg_color = background
-        self.pixels = [[self.bg_color for _ in range(width)] for _ in range(height)]
+        # Flat row-major RGB byte buffer: 3 bytes per pixel instead of a
+        # tuple object per pixel, so fills and row writes are contiguous
+        # C-level slice operations.
+        self.pixels = bytearray(bytes(background) * (width * height))
 
     def set_pixel(self, x: int, y: int, color: tuple):
         """
@@ -34,7 +37,22 @@ class PPMImage:
             color (tuple): RGB color tuple.
         """
         if 0 <= x < self.width and 0 <= y < self.height:
-            self.pixels[y][x] = color
+            i = (y * self.width + x) * 3
+            self.pixels[i:i + 3] = color
+
+    def get_pixel(self, x: int, y: int) -> tuple:
+        """
+        Get the color of a single pixel.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate (0 at top).
+
+        Returns:
+            tuple: RGB color tuple at (x, y).
+        """
+        i = (y * self.width + x) * 3
+        return tuple(self.pixels[i:i + 3])
 
     def draw_dot(self, x: int, y: int, radius: int = 1, color=(0, 0, 0)):
         """
@@ -46,28 +64,145 @@ class PPMImage:
             radius (int): Half-size of the dot (square).
             color (tuple): RGB color tuple.
         """
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                self.set_pixel(x + dx, y + dy, color)
+        # Clamp the square once, then fill it one row run at a time: a
+        # single slice assignment per row replaces (2r+1)**2 set_pixel
+        # calls with their per-pixel bounds checks.
+        x0 = max(0, x - radius)
+        x1 = min(self.width, x + radius + 1)
+        y0 = max(0, y - radius)
+        y1 = min(self.height, y + radius + 1)
+        if x0 >= x1 or y0 >= y1:
+            return
+        run = bytes(color) * (x1 - x0)
+        row_bytes = self.width * 3
+        pixels = self.pixels
+        for row in range(y0, y1):
+            start = row * row_bytes + x0 * 3
+            pixels[start:start + len(run)] = run
+
+    def hline(self, y: int, x0: int, x1: int, color=(0, 0, 0)):
+        """
+        Draw a horizontal line from x0 to x1 (inclusive) at row y.
+
+        The whole run is one clamped slice write into the pixel buffer.
+
+        Args:
+            y (int): Row of the line.
+            x0 (int): Leftmost X coordinate.
+            x1 (int): Rightmost X coordinate (inclusive).
+            color (tuple): RGB color tuple.
+        """
+        if not 0 <= y < self.height:
+            return
+        x0 = max(0, x0)
+        x1 = min(self.width - 1, x1)
+        if x0 > x1:
+            return
+        start = (y * self.width + x0) * 3
+        self.pixels[start:start + (x1 - x0 + 1) * 3] = bytes(color) * (x1 - x0 + 1)
+
+    def vline(self, x: int, y0: int, y1: int, color=(0, 0, 0)):
+        """
+        Draw a vertical line from y0 to y1 (inclusive) at column x.
+
+        Args:
+            x (int): Column of the line.
+            y0 (int): Topmost Y coordinate.
+            y1 (int): Bottommost Y coordinate (inclusive).
+            color (tuple): RGB color tuple.
+        """
+        if not 0 <= x < self.width:
+            return
+        y0 = max(0, y0)
+        y1 = min(self.height - 1, y1)
+        pixels = self.pixels
+        row_bytes = self.width * 3
+        color_bytes = bytes(color)
+        start = y0 * row_bytes + x * 3
+        for _ in range(y0, y1 + 1):
+            pixels[start:start + 3] = color_bytes
+            start += row_bytes
+
+    def draw_dots(self, coords, radius: int = 1, color=(0, 0, 0)):
+        """
+        Draw many same-color square dots in a single batched call.
+
+        The color run and all buffer constants are prepared once for the
+        whole batch, so each dot costs only its clamp plus row fills —
+        no per-dot method dispatch or run re-encoding as with repeated
+        draw_dot calls.
+
+        Args:
+            coords (iterable): Iterable of (x, y) center coordinates.
+            radius (int): Half-size of each dot (square).
+            color (tuple): RGB color tuple shared by all dots.
+        """
+        width = self.width
+        height = self.height
+        pixels = self.pixels
+        row_bytes = width * 3
+        color_bytes = bytes(color)
+        side = 2 * radius + 1
+        full_run = color_bytes * side
 
-    def save(self, path: str):
+        for x, y in coords:
+            x0 = x - radius
+            x1 = x + radius + 1
+            y0 = y - radius
+            y1 = y + radius + 1
+            if x0 < 0:
+                x0 = 0
+            if x1 > width:
+                x1 = width
+            if y0 < 0:
+                y0 = 0
+            if y1 > height:
+                y1 = height
+            if x0 >= x1:
+                continue
+            run = full_run if x1 - x0 == side else color_bytes * (x1 - x0)
+            for row in range(y0, y1):
+                start = row * row_bytes + x0 * 3
+                pixels[start:start + len(run)] = run
+
+    def save(self, path: str, fmt: str = "P6"):
         """
         Save the image to a .ppm file.
 
         Args:
             path (str): Output file path.
+            fmt (str): "P6" (default) emits binary PPM — the pixel buffer
+                       is already the P6 raster, so serialization is one
+                       raw write. "P3" keeps the ASCII format for tools
+                       that cannot read binary PPM.
+
+        Raises:
+            ValueError: If fmt is neither "P6" nor "P3".
         """
+        if fmt == "P6":
+            # 1 MiB buffer so multi-MB rasters reach the kernel in large
+            # chunks; the bytearray is handed to write() as-is, with no
+            # intermediate copy of the raster.
+            with open(path, "wb", buffering=1 << 20) as f:
+                f.write(b"P6\n%d %d\n255\n" % (self.width, self.height))
+                f.write(self.pixels)
+            return
+        if fmt != "P3":
+            raise ValueError(f"Unknown PPM format '{fmt}'. Expected 'P6' or 'P3'")
+
+        row_bytes = self.width * 3
         with open(path, "w") as f:
             f.write("P3\n")
             f.write(f"{self.width} {self.height}\n255\n")
-            for row in self.pixels:
-                for r, g, b in row:
-                    f.write(f"{r} {g} {b} ")
-                f.write("\n")
+            for start in range(0, len(self.pixels), row_bytes):
+                f.write(" ".join(map(str, self.pixels[start:start + row_bytes])) + " \n")
 
     def show(self):
         """
         Save the image to a temporary .ppm file and open it with the default image viewer.
+
+        The viewer launcher is spawned detached so the call returns right
+        after the fork instead of blocking until the launcher exits.
         """
         # Create temporary file path
         tmp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".ppm")
@@ -75,10 +210,25 @@ class PPMImage:
 
         # Determine platform and open
         if platform.system() == "Darwin":  # macOS
-            subprocess.run(["open", tmp_file.name])
+            self._launch_viewer(["open", tmp_file.name])
         elif platform.system() == "Windows":
             os.startfile(tmp_file.name)
         elif platform.system() == "Linux":
-            subprocess.run(["xdg-open", tmp_file.name])
+            self._launch_viewer(["xdg-open", tmp_file.name])
         else:
             print(f"Unsupported platform: {platform.system()}")
+
+    @staticmethod
+    def _launch_viewer(cmd):
+        """
+        Spawn a viewer launcher without waiting for it.
+
+        Args:
+            cmd (list): Launcher command and arguments.
+        """
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )